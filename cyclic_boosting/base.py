@@ -710,13 +710,25 @@ class CyclicBoostingBase(
         self._init_features()
         self._init_global_scale(X, y)
 
+    def _unlink_predictions(self, pred: CBLinkPredictionsFactors) -> np.ndarray:
+        """Prediction in target space that does not share memory with ``pred``.
+
+        ``pred`` is updated in place during the fit, while link functions such
+        as the identity may return a view of their input.
+        """
+        prediction_link = pred.predict_link()
+        prediction = self.unlink_func(prediction_link)
+        if np.may_share_memory(prediction, prediction_link):
+            prediction = prediction.copy()
+        return prediction
+
     def _fit_main(self, X: np.ndarray, y: np.ndarray, pred: CBLinkPredictionsFactors) -> np.ndarray:
         self.diverging = 0
         self.is_diverging = False
 
         _logger.info("Cyclic Boosting global scale {}".format(self.global_scale_))
 
-        prediction = self.unlink_func(pred.predict_link())
+        prediction = self._unlink_predictions(pred)
 
         self.insample_loss_ = self.loss(prediction, y, self.weights)
         self.initial_loss_ = self.insample_loss_
@@ -746,7 +758,7 @@ class CyclicBoostingBase(
                 else:
                     feature.factor_sum.append(np.sum(np.abs(feature.fitted_aggregated)))
 
-            prediction = self.unlink_func(pred.predict_link())
+            prediction = self._unlink_predictions(pred)
 
             updated_loss_change = self._update_loss(prediction, y)
             convergence_parameters.set_loss_change(updated_loss_change=updated_loss_change)
@@ -7,11 +7,45 @@
 from __future__ import absolute_import, division, print_function
 
 import abc
+import threading
 
 import numexpr
+import numexpr.necompiler
 import numpy as np
 import six
 
+#: Below this number of elements, plain NumPy ufuncs are faster than
+#: numexpr due to its thread dispatch overhead. Both paths may differ in
+#: the last ulp, so results can depend on the array length at that level.
+_NUMEXPR_THRESHOLD = 2**14
+
+
+#: The numexpr virtual machine is not thread-safe, and
+#: :func:`numexpr.evaluate` serializes its calls with this lock. Versions
+#: without it do not lock at all; then a lock of our own at least
+#: serializes the precompiled link expressions.
+_numexpr_lock = getattr(numexpr.necompiler, "evaluate_lock", None) or threading.Lock()
+
+
+def _compile(expr: str, var: str):
+    """Compile a numexpr expression of a single variable once, so that
+    float64 input skips the parsing and cache lookup of
+    :func:`numexpr.evaluate`. Input of other dtypes is passed to
+    :func:`numexpr.evaluate`, which determines the result dtype as usual.
+
+    The compiled expression is run while holding the same lock as
+    :func:`numexpr.evaluate`, so link functions stay safe to call from
+    several threads."""
+    compiled = numexpr.NumExpr(expr, signature=[(var, np.float64)])
+
+    def evaluate(x: np.ndarray) -> np.ndarray:
+        if x.dtype == np.float64:
+            with _numexpr_lock:
+                return compiled(x)
+        return numexpr.evaluate(expr, local_dict={var: x})
+
+    return staticmethod(evaluate)
+
 
 @six.add_metaclass(abc.ABCMeta)
 class LinkFunction(object):
@@ -39,6 +73,9 @@ class LogLinkMixin(LinkFunction):
 
     Supported values are in the range :math:`x > 0`"""
 
+    _link_expr = _compile("log(m)", "m")
+    _unlink_expr = _compile("exp(l)", "l")
+
     def unlink_func(self, l: np.ndarray) -> np.ndarray:
         r"""Calculates the inverse of the link function
 
@@ -46,7 +83,12 @@ class LogLinkMixin(LinkFunction):
 
            \mu = \exp(l)
         """
-        return numexpr.evaluate("exp(l)")
+        l = np.asarray(l)
+        if l.size < _NUMEXPR_THRESHOLD:
+            # numexpr does not warn about non-finite results either
+            with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+                return np.exp(l)
+        return self._unlink_expr(l)
 
     def is_in_range(self, m: np.ndarray) -> bool:
         return np.all(m > 0.0)
@@ -58,7 +100,12 @@ class LogLinkMixin(LinkFunction):
 
            l = \log(\mu)
         """
-        return numexpr.evaluate("log(m)")
+        m = np.asarray(m)
+        if m.size < _NUMEXPR_THRESHOLD:
+            # numexpr does not warn about non-finite results either
+            with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+                return np.log(m)
+        return self._link_expr(m)
 
 
 class LogitLinkMixin(LinkFunction):
@@ -67,8 +114,15 @@ class LogitLinkMixin(LinkFunction):
     Supported values are in the range :math:`0 \leq x \leq 1`
     """
 
+    _link_expr = _compile("log(p / (1. - p))", "p")
+    _unlink_expr = _compile("1. / (1. + exp(-l))", "l")
+
     def is_in_range(self, p: np.ndarray) -> bool:
-        return np.all(numexpr.evaluate("(p >= 0.0) & (p <= 1.0)"))
+        p = np.asarray(p)
+        if p.size == 0:
+            return True
+        # min/max reductions avoid allocating a boolean mask of the input size
+        return bool(p.min() >= 0.0 and p.max() <= 1.0)
 
     def link_func(self, p: np.ndarray) -> np.ndarray:
         r"""Calculates the logit-link
@@ -77,7 +131,7 @@ class LogitLinkMixin(LinkFunction):
 
            l = \log(\frac{p}{1-p})
         """
-        return numexpr.evaluate("log(p / (1. - p))")
+        return self._link_expr(np.asarray(p))
 
     def unlink_func(self, l: np.ndarray) -> np.ndarray:
         r"""Inverse of logit-link
@@ -86,7 +140,7 @@ class LogitLinkMixin(LinkFunction):
 
            p = \frac{1}{1+ \exp(-l)}
         """
-        return numexpr.evaluate("1. / (1. + exp(-l))")
+        return self._unlink_expr(np.asarray(l))
 
 
 class IdentityLinkMixin(LinkFunction):
@@ -96,12 +150,12 @@ class IdentityLinkMixin(LinkFunction):
         return True
 
     def link_func(self, m: np.ndarray):
-        r"""Returns a copy of the input"""
-        return m.copy()
+        r"""Returns the input itself, without copying"""
+        return m
 
     def unlink_func(self, l: np.ndarray):
-        r"""Returns a copy of the input"""
-        return l.copy()
+        r"""Returns the input itself, without copying"""
+        return l
 
 
 __all__ = [
@@ -473,6 +473,34 @@ def test_location_regression_default_features(is_plot, feature_properties, defau
     np.testing.assert_almost_equal(mad, 1.7511, 3)
 
 
+class RecordingObserver(observers.BaseObserver):
+    def __init__(self):
+        self.recorded = []
+
+    def observe_iterations(self, iteration, X, y, prediction, weights, estimator_state, delta=None):
+        self.recorded.append((prediction, prediction.copy()))
+
+    def observe_feature_iterations(self, iteration, feature_i, X, y, prediction, weights, estimator_state):
+        self.recorded.append((prediction, prediction.copy()))
+
+
+def test_location_regression_observed_predictions_not_aliased(feature_properties, default_features, prepare_data):
+    X, y = prepare_data
+    X = X[default_features]
+
+    obs = RecordingObserver()
+    CB_est = pipeline_CBLocationRegressor(feature_properties=feature_properties, observers=[obs], maximal_iterations=3)
+    CB_est.fit(X, y)
+
+    # the identity link must not hand out views of the in-place updated link predictions
+    assert len(obs.recorded) > 0
+    for prediction, snapshot in obs.recorded:
+        np.testing.assert_array_equal(prediction, snapshot)
+
+    final_prediction, _ = obs.recorded[-1]
+    np.testing.assert_allclose(final_prediction, CB_est.predict(X))
+
+
 @pytest.fixture(scope="function")
 def cb_width_model(feature_properties):
     features = ["dayofweek", "L_ID", "PG_ID_3", "PROMOTION_TYPE"]
@@ -1,4 +1,8 @@
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
+import pytest
 
 from cyclic_boosting import link
 
@@ -8,7 +12,7 @@ def test_loglink_simple():
     x = np.linspace(1, 100)
     np.testing.assert_allclose(loglink.unlink_func(loglink.link_func(x)), x)
 
-    assert loglink.link_func(np.e**10) == 10.0
+    np.testing.assert_almost_equal(loglink.link_func(np.e**10), 10.0)
     assert loglink.is_in_range(np.e**10)
     assert loglink.is_in_range(np.asarray(np.linspace(0.5, 10)))
     assert not loglink.is_in_range(np.asarray(np.linspace(0.0, 10)))
@@ -16,6 +20,60 @@ def test_loglink_simple():
     assert not loglink.is_in_range(np.ones(10) * -1)
 
 
+def test_loglink_non_finite_without_warnings():
+    loglink = link.LogLinkMixin()
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert loglink.link_func(np.array([0.0])) == -np.inf
+        assert np.isnan(loglink.link_func(np.array([-1.0])))
+        assert loglink.unlink_func(np.array([1000.0])) == np.inf
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_loglink_numexpr_threshold(dtype):
+    loglink = link.LogLinkMixin()
+    n = link._NUMEXPR_THRESHOLD
+    x = np.linspace(0.1, 100, n, dtype=dtype)
+    rtol = np.finfo(dtype).eps * 4
+
+    # below the threshold NumPy is used, at and above it numexpr
+    link_small, link_large = loglink.link_func(x[:-1]), loglink.link_func(x)
+    np.testing.assert_allclose(link_large[:-1], link_small, rtol=rtol)
+
+    l = np.linspace(-5, 5, n, dtype=dtype)
+    unlink_small, unlink_large = loglink.unlink_func(l[:-1]), loglink.unlink_func(l)
+    np.testing.assert_allclose(unlink_large[:-1], unlink_small, rtol=rtol)
+
+
+@pytest.mark.parametrize("n", [10, link._NUMEXPR_THRESHOLD])
+@pytest.mark.parametrize(
+    "dtype, log_dtype, logit_dtype",
+    [(np.float64, np.float64, np.float64), (np.float32, np.float32, np.float64), (np.int64, np.float64, np.float64)],
+)
+def test_link_result_dtype(n, dtype, log_dtype, logit_dtype):
+    # result dtypes follow numexpr.evaluate and do not depend on the array length
+    x = np.ones(n, dtype=dtype)
+    loglink = link.LogLinkMixin()
+    assert loglink.link_func(x).dtype == log_dtype
+    assert loglink.unlink_func(x).dtype == log_dtype
+
+    logitlink = link.LogitLinkMixin()
+    assert logitlink.link_func(x).dtype == logit_dtype
+    assert logitlink.unlink_func(x).dtype == logit_dtype
+
+
+def test_precompiled_link_threads():
+    logitlink = link.LogitLinkMixin()
+    x = np.linspace(0.001, 0.999, 2 * link._NUMEXPR_THRESHOLD)
+    expected = logitlink.link_func(x)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: logitlink.link_func(x), range(16)))
+
+    for result in results:
+        np.testing.assert_array_equal(result, expected)
+
+
 def test_logitlink_simple():
     logitlink = link.LogitLinkMixin()
     x = np.linspace(0.001, 0.999)
@@ -24,6 +82,12 @@ def test_logitlink_simple():
     assert logitlink.link_func(0.5) == 0.0
     assert logitlink.link_func(0.25) == np.log(1.0 / 3)
     np.testing.assert_almost_equal(logitlink.link_func(0.75), np.log(3.0), 5)
+    assert logitlink.is_in_range(x)
+    assert logitlink.is_in_range(np.array([0.0, 1.0]))
+    assert not logitlink.is_in_range(np.array([0.5, np.nan]))
+    assert logitlink.is_in_range(np.array([]))
+    assert logitlink.is_in_range(0.5)
+    assert not logitlink.is_in_range(1.5)
     assert not logitlink.is_in_range(np.asarray(np.linspace(0.5, 10)))
     assert not logitlink.is_in_range(np.linspace(-1, 2))
     assert not logitlink.is_in_range(np.ones(10) * 1.01)